@@ -1,47 +1,117 @@
+import logging
+import os
 import uuid
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-
-from .schemas import CreateJobRequest, Job, JobStatus
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Query, Request, Response
+
+from .compression import choose_encoding
+from .container import ServiceContainer
+from .profiling import profiled
+from .schemas import Article, CreateJobRequest, Job, JobPage, JobStatus, Language
 from .store import JobStore
+from .webhooks import WebhookDispatcher
 from .services.serp_client import SERPClient
 from .services.analyzer import SERPAnalyzer
 from .services.outline_generator import OutlineGenerator
 from .services.article_generator import ArticleGenerator
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
-job_store = JobStore()
 
-serp_client = SERPClient()
-analyzer = SERPAnalyzer()
-outline_generator = OutlineGenerator()
-article_generator = ArticleGenerator()
+# Services are built on first use (or by warm_up) rather than at import time
+container = ServiceContainer()
+container.register(JobStore)
+container.register(SERPClient)
+container.register(SERPAnalyzer)
+container.register(OutlineGenerator)
+container.register(ArticleGenerator)
+container.register(
+    WebhookDispatcher,
+    lambda: WebhookDispatcher(
+        outbox_path=os.environ.get("WEBHOOK_OUTBOX_PATH", "webhook_outbox.sqlite3"),
+        secret=os.environ.get("WEBHOOK_SECRET", ""),
+        allowed_hosts=os.environ.get("WEBHOOK_ALLOWED_HOSTS", "").split(","),
+    ),
+)
+
+
+def get_job_store() -> JobStore:
+    return container.get(JobStore)
+
+
+def get_webhook_dispatcher() -> WebhookDispatcher:
+    return container.get(WebhookDispatcher)
+
+
+def warm_up() -> None:
+    """
+    Build all services and run one throwaway generation so the first real
+    request does not pay for lazy construction or first-call costs.
+    """
+    container.warm_up()
+    _generate_article(topic="warm up", target_word_count=500)
+    # Resume delivery of events left in the outbox by a previous run
+    get_webhook_dispatcher().start()
+
+
+def shutdown() -> None:
+    container.shutdown()
+
+
+def _generate_article(topic: str, target_word_count: int, language: Language = Language.en) -> Article:
+    # 1) Fetch SERP data
+    serp_results = container.get(SERPClient).fetch_top_results(topic=topic, limit=10)
+
+    # 2) Analyze SERP
+    analysis = container.get(SERPAnalyzer).analyze(
+        topic=topic, serp_results=serp_results, language=language
+    )
+
+    # 3) Generate outline
+    outline = container.get(OutlineGenerator).generate(topic=topic, analysis=analysis)
+
+    # 4) Generate article
+    return container.get(ArticleGenerator).generate_article(
+        outline=outline,
+        analysis=analysis,
+        target_word_count=target_word_count,
+    )
 
 
-def _run_pipeline(job_id: str) -> None:
+def _run_pipeline(job_id: str, job_store: JobStore, webhooks: WebhookDispatcher | None = None) -> None:
     job = job_store.get(job_id)
     if not job:
         return
 
-    try:
-        job_store.update_status(job_id, JobStatus.running)
-
-        # 1) Fetch SERP data
-        serp_results = serp_client.fetch_top_results(topic=job.topic, limit=10)
+    _execute_job(job, job_store)
 
-        # 2) Analyze SERP
-        analysis = analyzer.analyze(topic=job.topic, serp_results=serp_results)
+    if webhooks is not None:
+        webhooks.notify(job_store.get(job_id))
 
-        # 3) Generate outline
-        outline = outline_generator.generate(topic=job.topic, analysis=analysis)
 
-        # 4) Generate article
-        article = article_generator.generate_article(
-            outline=outline,
-            analysis=analysis,
-            target_word_count=job.target_word_count,
-        )
+def _execute_job(job: Job, job_store: JobStore) -> None:
+    job_id = job.id
+    try:
+        job_store.update_status(job_id, JobStatus.running)
 
-        # 5) Save article + mark complete
+        # Only generation is profiled, and the stats are saved before the job
+        # is marked complete, so a client that sees "completed" can fetch the
+        # profile straight away
+        profiling = profiled(lambda stats: job_store.save_profile(job_id, stats)) if job.profile else nullcontext(False)
+        with profiling as active:
+            if job.profile and not active:
+                logger.warning("Profiler busy; running job %s unprofiled", job_id)
+                job_store.skip_profile(job_id)
+            article = _generate_article(
+                topic=job.topic,
+                target_word_count=job.target_word_count,
+                language=job.language,
+            )
+
+        # Save article + mark complete
         job_store.save_article(job_id, article)
         job_store.update_status(job_id, JobStatus.completed)
 
@@ -50,7 +120,18 @@ def _run_pipeline(job_id: str) -> None:
 
 
 @router.post("/jobs", response_model=Job)
-def create_job(payload: CreateJobRequest, background_tasks: BackgroundTasks):
+def create_job(
+    payload: CreateJobRequest,
+    background_tasks: BackgroundTasks,
+    job_store: JobStore = Depends(get_job_store),
+    webhooks: WebhookDispatcher = Depends(get_webhook_dispatcher),
+):
+    if payload.callback_url is not None:
+        try:
+            webhooks.validate(str(payload.callback_url))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
     job_id = str(uuid.uuid4())
     job = Job(
         id=job_id,
@@ -58,18 +139,83 @@ def create_job(payload: CreateJobRequest, background_tasks: BackgroundTasks):
         target_word_count=payload.target_word_count,
         language=payload.language,
         status=JobStatus.pending,
+        profile=payload.profile,
+        callback_url=payload.callback_url,
     )
     job_store.create(job)
 
     # Run asynchronously so the API returns quickly
-    background_tasks.add_task(_run_pipeline, job_id)
+    background_tasks.add_task(_run_pipeline, job_id, job_store, webhooks if job.callback_url else None)
 
     return job
 
 
+@router.get("/jobs", response_model=JobPage)
+def list_jobs(
+    status: Optional[JobStatus] = None,
+    topic_prefix: Optional[str] = None,
+    language: Optional[Language] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    job_store: JobStore = Depends(get_job_store),
+):
+    try:
+        items, next_cursor = job_store.list(
+            status=status,
+            topic_prefix=topic_prefix,
+            language=language,
+            created_after=created_after,
+            created_before=created_before,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return JobPage(items=items, next_cursor=next_cursor)
+
+
 @router.get("/jobs/{job_id}", response_model=Job)
-def get_job(job_id: str):
+def get_job(
+    job_id: str,
+    request: Request,
+    response: Response,
+    job_store: JobStore = Depends(get_job_store),
+):
+    # Serve a precompressed body when the client accepts one we can produce
+    encoding = choose_encoding(request.headers.get("accept-encoding"), job_store.response_encodings)
+    if encoding is not None:
+        encoded = job_store.get_encoded(job_id, encoding)
+        if encoded is not None:
+            return Response(
+                content=encoded,
+                media_type="application/json",
+                headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            )
+
     job = job_store.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    response.headers["Vary"] = "Accept-Encoding"
     return job
+
+
+@router.get("/jobs/{job_id}/profile")
+def get_job_profile(job_id: str, job_store: JobStore = Depends(get_job_store)):
+    stats = job_store.get_profile(job_id)
+    if stats is None:
+        if not job_store.exists(job_id):
+            raise HTTPException(status_code=404, detail="Job not found")
+        if job_store.profile_skipped(job_id):
+            raise HTTPException(
+                status_code=404,
+                detail="Profile not available: another job was being profiled, so this one ran unprofiled",
+            )
+        raise HTTPException(status_code=404, detail="Profile not available")
+
+    return Response(
+        content=stats,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{job_id}.pstats"'},
+    )
@@ -0,0 +1,140 @@
+from textwrap import fill
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+# A paragraph part is either a reference into the fragment table (int) or a
+# topic-specific slot kept inline (str).
+Part = Union[int, str]
+
+PARAGRAPH_WIDTH = 90
+
+
+class FragmentTable:
+    """
+    Interned template strings shared by every article. Articles store the
+    integer id instead of another copy of the text.
+    """
+
+    def __init__(self) -> None:
+        self._fragments: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def intern(self, text: str) -> int:
+        fragment_id = self._ids.get(text)
+        if fragment_id is not None:
+            return fragment_id
+
+        with self._lock:
+            if text not in self._ids:
+                self._ids[text] = len(self._fragments)
+                self._fragments.append(text)
+            return self._ids[text]
+
+    def resolve(self, part: Part) -> str:
+        return self._fragments[part] if isinstance(part, int) else part
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+
+fragments = FragmentTable()
+
+
+class Paragraph:
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: Iterable[Part]) -> None:
+        self.parts: Tuple[Part, ...] = tuple(parts)
+
+    def to_markdown(self) -> str:
+        return fill("".join(fragments.resolve(p) for p in self.parts), width=PARAGRAPH_WIDTH)
+
+
+class Section:
+    __slots__ = ("heading", "level", "paragraphs")
+
+    def __init__(self, heading: str, level: int, paragraphs: Iterable[Paragraph]) -> None:
+        self.heading = heading
+        self.level = level
+        self.paragraphs: Tuple[Paragraph, ...] = tuple(paragraphs)
+
+    def to_markdown_lines(self) -> List[str]:
+        if self.level in (2, 3):
+            lines = ["#" * self.level + " " + self.heading, ""]
+        else:
+            lines = [f"#### {self.heading}", ""]
+        for paragraph in self.paragraphs:
+            lines.append(paragraph.to_markdown())
+            lines.append("")
+        return lines
+
+
+class ArticleBody:
+    """
+    Compact article body: an intro paragraph plus sections, each made of
+    fragment references and slots. Markdown is rebuilt on every call to
+    `to_markdown()`; only bodies wrapped with `from_markdown()` (articles that
+    arrived as rendered markdown, e.g. from a client) keep the text itself.
+    """
+
+    __slots__ = ("intro", "sections", "_markdown")
+
+    def __init__(self, intro: Paragraph | None, sections: Iterable[Section]) -> None:
+        self.intro = intro
+        self.sections: Tuple[Section, ...] = tuple(sections)
+        self._markdown: str | None = None
+
+    @classmethod
+    def from_markdown(cls, markdown: str) -> "ArticleBody":
+        """
+        Wrap already-rendered markdown (e.g. an article loaded from JSON).
+        """
+        body = cls(intro=None, sections=())
+        body._markdown = markdown
+        return body
+
+    def to_parts(self) -> Dict[str, Any]:
+        """
+        JSON-able compact form. Fragment ids are only meaningful to this
+        process's fragment table, so this is for in-process storage (JobStore),
+        not for clients.
+        """
+        if self._markdown is not None:
+            return {"markdown": self._markdown}
+        return {
+            "intro": list(self.intro.parts) if self.intro is not None else None,
+            "sections": [
+                [section.heading, section.level, [list(p.parts) for p in section.paragraphs]]
+                for section in self.sections
+            ],
+        }
+
+    @classmethod
+    def from_parts(cls, data: Dict[str, Any]) -> "ArticleBody":
+        if "markdown" in data:
+            return cls.from_markdown(data["markdown"])
+        return cls(
+            intro=Paragraph(data["intro"]) if data["intro"] is not None else None,
+            sections=[
+                Section(heading, level, [Paragraph(parts) for parts in paragraphs])
+                for heading, level, paragraphs in data["sections"]
+            ],
+        )
+
+    def to_markdown(self) -> str:
+        if self._markdown is not None:
+            return self._markdown
+
+        lines: List[str] = []
+        if self.intro is not None:
+            lines.append(self.intro.to_markdown())
+            lines.append("")
+        for section in self.sections:
+            lines.extend(section.to_markdown_lines())
+        return "\n".join(lines)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArticleBody):
+            return NotImplemented
+        return self.to_markdown() == other.to_markdown()
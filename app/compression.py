@@ -0,0 +1,95 @@
+import gzip
+from threading import local
+from typing import Dict, List
+
+try:  # zstd is optional; gzip is always available
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+
+class Codec:
+    """
+    Compresses stored payloads and responses. The encoding name doubles as
+    the HTTP Content-Encoding token.
+    """
+
+    def __init__(self, encoding: str | None = None) -> None:
+        if encoding is None:
+            encoding = "zstd" if zstandard is not None else "gzip"
+
+        if encoding == "zstd":
+            self.encoding = "zstd"
+            # zstd (de)compressor objects must not be shared between threads
+            self._local = local()
+        elif encoding == "gzip":
+            self.encoding = "gzip"
+        else:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "zstd":
+            compressor = getattr(self._local, "compressor", None)
+            if compressor is None:
+                compressor = self._local.compressor = zstandard.ZstdCompressor(level=10)
+            return compressor.compress(data)
+        # mtime=0 keeps the output deterministic for identical payloads
+        return gzip.compress(data, compresslevel=9, mtime=0)
+
+    def decompress(self, data: bytes) -> bytes:
+        if self.encoding == "zstd":
+            decompressor = getattr(self._local, "decompressor", None)
+            if decompressor is None:
+                decompressor = self._local.decompressor = zstandard.ZstdDecompressor()
+            return decompressor.decompress(data)
+        return gzip.decompress(data)
+
+
+def available_encodings() -> List[str]:
+    """
+    Encodings this process can produce, in server preference order.
+    """
+    return ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+
+
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[name] = q
+    return qualities
+
+
+def accepts_encoding(accept_encoding: str | None, encoding: str) -> bool:
+    """
+    Minimal Accept-Encoding check: True if `encoding` is listed without q=0,
+    or is not listed and `*` is. An explicit token always wins over `*`.
+    """
+    if not accept_encoding:
+        return False
+
+    qualities = _parse_accept_encoding(accept_encoding)
+    q = qualities.get(encoding, qualities.get("*", 0.0))
+    return q > 0
+
+
+def choose_encoding(accept_encoding: str | None, encodings: List[str]) -> str | None:
+    """
+    First of `encodings` (server preference order) the client accepts.
+    """
+    for encoding in encodings:
+        if accepts_encoding(accept_encoding, encoding):
+            return encoding
+    return None
@@ -0,0 +1,57 @@
+from threading import Lock
+from typing import Any, Callable, Dict, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class ServiceContainer:
+    """
+    Builds each registered service on first use and keeps it as a singleton.
+    Nothing is constructed at import time; `warm_up()` builds everything ahead
+    of traffic and calls each service's optional `warm_up()` hook, and
+    `shutdown()` calls each built service's optional `stop()` hook.
+    """
+
+    def __init__(self) -> None:
+        self._factories: Dict[type, Callable[[], Any]] = {}
+        self._instances: Dict[type, Any] = {}
+        self._lock = Lock()
+
+    def register(self, service_type: Type[T], factory: Callable[[], T] | None = None) -> None:
+        self._factories[service_type] = factory or service_type
+
+    def get(self, service_type: Type[T]) -> T:
+        instance = self._instances.get(service_type)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            # Another thread may have built it while we waited
+            if service_type not in self._instances:
+                self._instances[service_type] = self._factories[service_type]()
+            return self._instances[service_type]
+
+    def is_built(self, service_type: type) -> bool:
+        return service_type in self._instances
+
+    def warm_up(self) -> None:
+        for service_type in list(self._factories):
+            hook = getattr(self.get(service_type), "warm_up", None)
+            if callable(hook):
+                hook()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            instances = list(self._instances.values())
+        for instance in instances:
+            hook = getattr(instance, "stop", None)
+            if callable(hook):
+                hook()
+
+    def reset(self) -> None:
+        """
+        Stop and forget every built service; the next `get()` builds afresh.
+        """
+        self.shutdown()
+        with self._lock:
+            self._instances.clear()
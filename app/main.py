@@ -1,10 +1,22 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from .api import router as api_router
+from .api import router as api_router, shutdown, warm_up
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs before the server starts accepting traffic
+    warm_up()
+    yield
+    shutdown()
+
 
 app = FastAPI(
     title="SEO Article Agent",
     description="Backend service to generate SEO-optimized articles from a topic.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.include_router(api_router, prefix="/api")
@@ -0,0 +1,36 @@
+import cProfile
+import marshal
+from contextlib import contextmanager
+from threading import Lock
+from typing import Callable, Iterator
+
+# Only one deterministic profiler can be active per interpreter on newer
+# Pythons, so only one job is profiled at a time. Unprofiled jobs never touch this.
+_profiler_lock = Lock()
+
+
+@contextmanager
+def profiled(on_done: Callable[[bytes], None]) -> Iterator[bool]:
+    """
+    Run the block under cProfile and pass the result to `on_done` in pstats
+    format (the same bytes `Profile.dump_stats` writes; load with
+    `pstats.Stats(path)` or convert for speedscope/snakeviz).
+
+    Never waits for the profiler: if another job holds it, the block runs
+    unprofiled and the context value is False.
+    """
+    if not _profiler_lock.acquire(blocking=False):
+        yield False
+        return
+
+    try:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield True
+        finally:
+            profiler.disable()
+            profiler.create_stats()
+            on_done(marshal.dumps(profiler.stats))
+    finally:
+        _profiler_lock.release()
@@ -1,11 +1,17 @@
+from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field, HttpUrl
+from typing import Any, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, computed_field, model_validator
+from pydantic.json_schema import SkipJsonSchema
+
+from .article_body import ArticleBody
 
 
 class Language(str, Enum):
     en = "en"
-    # extend later if needed
+    de = "de"
+    fr = "fr"
+    es = "es"
 
 
 class JobStatus(str, Enum):
@@ -82,16 +88,50 @@ class SEOData(BaseModel):
 
 
 class Article(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     h1: str
-    body_markdown: str
+    # Compact fragment-based body; serialized as `body_markdown` only
+    body: SkipJsonSchema[ArticleBody] = Field(exclude=True)
     word_count: int
     seo: SEOData
 
+    @model_validator(mode="before")
+    @classmethod
+    def _build_body(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        if isinstance(data.get("body"), dict):
+            # Compact form written by `to_storage()`
+            data = dict(data)
+            data["body"] = ArticleBody.from_parts(data["body"])
+        elif "body" not in data and "body_markdown" in data:
+            # Public serialized form, e.g. JSON from clients
+            data = dict(data)
+            data["body"] = ArticleBody.from_markdown(data.pop("body_markdown"))
+        return data
+
+    def to_storage(self) -> dict:
+        """
+        JSON-able dict that keeps the body as fragment references instead of
+        markdown; `Article.model_validate()` reads it back.
+        """
+        data = self.model_dump(mode="json", exclude={"body_markdown"})
+        data["body"] = self.body.to_parts()
+        return data
+
+    @computed_field
+    @property
+    def body_markdown(self) -> str:
+        return self.body.to_markdown()
+
 
 class CreateJobRequest(BaseModel):
     topic: str
     target_word_count: int = 1500
     language: Language = Language.en
+    profile: bool = False  # run this job under cProfile, see GET /api/jobs/{id}/profile
+    callback_url: Optional[HttpUrl] = None  # receives a signed webhook when the job completes or fails
 
 
 class Job(BaseModel):
@@ -100,5 +140,13 @@ class Job(BaseModel):
     target_word_count: int
     language: Language
     status: JobStatus
+    profile: bool = False
+    callback_url: Optional[HttpUrl] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     error_message: Optional[str] = None
     article: Optional[Article] = None
+
+
+class JobPage(BaseModel):
+    items: List[Job]  # listed jobs never include the article
+    next_cursor: Optional[str] = None
@@ -1,32 +1,36 @@
 from collections import Counter
 from typing import List
-import re
 
-from ..schemas import SERPResult, SERPAnalysis
-
-
-def _tokenize(text: str) -> List[str]:
-    return re.findall(r"[a-zA-Z]{3,}", text.lower())
+from ..schemas import Language, SERPResult, SERPAnalysis
+from .tokenizers import get_tokenizer
 
 
 class SERPAnalyzer:
-    def analyze(self, topic: str, serp_results: List[SERPResult]) -> SERPAnalysis:
+    def warm_up(self) -> None:
+        # Compile every language's tokenizer before traffic arrives
+        for language in Language:
+            get_tokenizer(language)
+
+    def analyze(
+        self,
+        topic: str,
+        serp_results: List[SERPResult],
+        language: Language = Language.en,
+    ) -> SERPAnalysis:
         all_text = " ".join(r.title + " " + r.snippet for r in serp_results)
-        tokens = _tokenize(all_text)
-        counts = Counter(tokens)
+        counts = Counter(get_tokenizer(language).content_tokens(all_text))
 
         # crude heuristic for "secondary keywords"
-        common_terms = [w for w, c in counts.most_common(50)
-                        if w not in {"best", "tools", "guide", "remote", "team", "teams"}]
+        common_terms = [w for w, _ in counts.most_common(50)]
 
         primary_keyword = topic.lower()
         secondary_keywords = common_terms[:10]
 
         # themes from coarser grouping
         themes = []
-        if "collaboration" in tokens:
+        if "collaboration" in counts:
             themes.append("Collaboration & communication")
-        if "automation" in tokens:
+        if "automation" in counts:
             themes.append("Automation & workflows")
         themes.append("Pricing & ROI")
         themes.append("Implementation tips & onboarding")
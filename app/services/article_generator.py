@@ -1,6 +1,6 @@
-from textwrap import fill
-from typing import List
+from typing import List, Tuple
 
+from ..article_body import ArticleBody, Paragraph, Part, Section, fragments
 from ..schemas import (
     Article,
     Outline,
@@ -13,21 +13,34 @@ from ..schemas import (
     SEOScore,
 )
 
-
-def _make_paragraph(text: str) -> str:
-    return fill(text, width=90)
+# Template text shared by every article lives once in the fragment table;
+# paragraphs only hold these ids plus the topic-specific slots.
+_VARIANT_SUFFIXES = [
+    fragments.intern(" When you evaluate tools for remote teams, try to ground every claim in a concrete workflow or use case."),
+    fragments.intern(" Instead of staying abstract, show what this looks like inside a real remote team using specific tools."),
+    fragments.intern(" In practice, the best productivity tools for remote teams are the ones that fit your existing stack and habits."),
+    fragments.intern(" Back this up with screenshots, checklists, or real examples so the reader can picture using the tool tomorrow."),
+]
+_TRADE_OFF = fragments.intern(
+    " Focus on the trade-offs, not just a features list, so the reader can make a confident decision."
+)
+_BRIDGE = fragments.intern(
+    "As you read through this section, map each idea to your own team: "
+    "what tools you already use, where work gets stuck, and which gaps a new tool could realistically fill."
+)
+_INTRO_PREFIX = fragments.intern("If you're looking for ")
+_INTRO_SUFFIX = fragments.intern(
+    ", you're not alone. "
+    "In this guide, we'll break down what actually works in 2025, "
+    "based on what’s ranking today and how real teams use these tools in day-to-day work."
+)
 
 
-def _sentence_variants(point: str, primary: str) -> List[str]:
+def _sentence_variants(point: str, primary: str) -> List[Tuple[Part, ...]]:
     """
     Simple templates to avoid repeating the exact same sentence over and over.
     """
-    return [
-        f"{point} When you evaluate tools for remote teams, try to ground every claim in a concrete workflow or use case.",
-        f"{point} Instead of staying abstract, show what this looks like inside a real remote team using specific tools.",
-        f"{point} In practice, the best productivity tools for remote teams are the ones that fit your existing stack and habits.",
-        f"{point} Back this up with screenshots, checklists, or real examples so the reader can picture using the tool tomorrow.",
-    ]
+    return [(point, suffix) for suffix in _VARIANT_SUFFIXES]
 
 
 class ArticleGenerator:
@@ -42,48 +55,29 @@ class ArticleGenerator:
         # H1: just use the primary keyword nicely formatted
         h1 = f"{primary.title()} (2025 Guide)"
 
-        body_lines: List[str] = []
-
         # Intro paragraph with primary keyword
-        intro = (
-            f"If you're looking for {primary}, you're not alone. "
-            f"In this guide, we'll break down what actually works in 2025, "
-            f"based on what’s ranking today and how real teams use these tools in day-to-day work."
-        )
-        body_lines.append(_make_paragraph(intro))
-        body_lines.append("")
+        intro = Paragraph((_INTRO_PREFIX, primary, _INTRO_SUFFIX))
 
-        # Convert outline sections to markdown
+        # Convert outline sections to compact sections
+        sections: List[Section] = []
         for section in outline.sections:
-            if section.level == 2:
-                body_lines.append(f"## {section.heading}")
-            elif section.level == 3:
-                body_lines.append(f"### {section.heading}")
-            else:
-                body_lines.append(f"#### {section.heading}")
-
-            body_lines.append("")
+            paragraphs: List[Paragraph] = []
 
             for idx, point in enumerate(section.content_points):
                 variants = _sentence_variants(point, primary)
                 # rotate through variants so text feels more natural
                 sentence = variants[idx % len(variants)]
-                paragraph = (
-                    sentence
-                    + " Focus on the trade-offs, not just a features list, so the reader can make a confident decision."
-                )
-                body_lines.append(_make_paragraph(paragraph))
-                body_lines.append("")
+                paragraphs.append(Paragraph(sentence + (_TRADE_OFF,)))
 
             # add a small bridging paragraph per section
-            bridge = (
-                "As you read through this section, map each idea to your own team: "
-                "what tools you already use, where work gets stuck, and which gaps a new tool could realistically fill."
-            )
-            body_lines.append(_make_paragraph(bridge))
-            body_lines.append("")
-
-        body_markdown = "\n".join(body_lines)
+            paragraphs.append(Paragraph((_BRIDGE,)))
+
+            sections.append(Section(section.heading, section.level, paragraphs))
+
+        body = ArticleBody(intro=intro, sections=sections)
+
+        # Materialized once here for scoring; the Article keeps only `body`
+        body_markdown = body.to_markdown()
         word_count = len(body_markdown.split())
 
         seo = self._build_seo_data(
@@ -97,7 +91,7 @@ class ArticleGenerator:
 
         return Article(
             h1=h1,
-            body_markdown=body_markdown,
+            body=body,
             word_count=word_count,
             seo=seo,
         )
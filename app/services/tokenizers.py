@@ -0,0 +1,119 @@
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Pattern
+
+from ..schemas import Language
+
+# Generic SERP filler that never makes a useful secondary keyword
+_SERP_FILLER = {"best", "tools", "guide", "remote", "team", "teams"}
+
+_STOPWORDS: Dict[Language, FrozenSet[str]] = {
+    Language.en: frozenset(_SERP_FILLER | {
+        "the", "and", "for", "with", "this", "that", "are", "you", "your", "from",
+        "how", "what", "more", "about", "into", "can", "all", "our", "its", "has",
+        "have", "was", "were", "will", "not", "but", "they", "their", "who", "which",
+    }),
+    Language.de: frozenset({
+        "beste", "besten", "tools", "ratgeber", "remote", "team", "teams",
+        "der", "die", "das", "und", "mit", "für", "von", "den", "dem", "des",
+        "ein", "eine", "einen", "einer", "ist", "sind", "wie", "was", "auf",
+        "aus", "bei", "nicht", "auch", "sich", "ihr", "ihre", "oder", "zum", "zur",
+    }),
+    Language.fr: frozenset({
+        "meilleurs", "meilleures", "outils", "guide", "équipe", "équipes", "distance",
+        "les", "des", "une", "pour", "dans", "avec", "sur", "par", "est", "sont",
+        "qui", "que", "aux", "vos", "votre", "nos", "notre", "pas", "plus", "comme",
+        "ces", "cette", "leur", "leurs", "mais", "ont",
+    }),
+    Language.es: frozenset({
+        "mejores", "herramientas", "guía", "remoto", "remotos", "equipo", "equipos",
+        "los", "las", "del", "una", "para", "con", "por", "que", "como", "más",
+        "sus", "son", "está", "están", "pero", "este", "esta", "estos", "estas",
+        "sobre", "entre", "sin", "también", "tus", "nuestro",
+    }),
+}
+
+
+def normalize(text: str) -> str:
+    """
+    Case-fold first (so e.g. "İ" folds to "i" + combining dot), then compose
+    decomposed accents (e + U+0301 -> é). ASCII skips the Unicode work.
+    """
+    text = text.casefold()
+    if not text.isascii():
+        text = unicodedata.normalize("NFC", text)
+    return text
+
+
+@lru_cache(maxsize=None)
+def word_pattern() -> str:
+    """
+    Runs of 3+ letters or combining marks in any script. Python's \\w has no
+    marks (Mn/Mc/Me), which would split words in Devanagari, Thai, etc., so the
+    mark ranges are collected from unicodedata once per process. On ASCII
+    input this matches exactly what the old [a-zA-Z]{3,} did.
+    """
+    ranges = []
+    start = prev = None
+    for cp in range(sys.maxunicode + 1):
+        if unicodedata.category(chr(cp))[0] != "M":
+            continue
+        if start is None:
+            start = cp
+        elif cp != prev + 1:
+            ranges.append((start, prev))
+            start = cp
+        prev = cp
+    ranges.append((start, prev))
+
+    marks = "".join(re.escape(chr(a)) if a == b else f"{re.escape(chr(a))}-{re.escape(chr(b))}" for a, b in ranges)
+    return rf"(?:[^\W\d_]|[{marks}]){{3,}}"
+
+
+class Tokenizer:
+    """
+    Compiled word pattern plus stopword table for one language. Subclass and
+    override `tokenize` (then `register_tokenizer`) for languages that need
+    more than a regex, e.g. word segmentation.
+    """
+
+    def __init__(self, language: Language, pattern: Pattern[str], stopwords: Iterable[str]) -> None:
+        self.language = language
+        self.pattern = pattern
+        self.stopwords: FrozenSet[str] = frozenset(normalize(w) for w in stopwords)
+
+    def tokenize(self, text: str) -> List[str]:
+        return self.pattern.findall(normalize(text))
+
+    def content_tokens(self, text: str) -> List[str]:
+        stopwords = self.stopwords
+        return [t for t in self.tokenize(text) if t not in stopwords]
+
+
+def default_tokenizer(language: Language) -> Tokenizer:
+    return Tokenizer(
+        language=language,
+        pattern=re.compile(word_pattern()),
+        stopwords=_STOPWORDS.get(language, frozenset()),
+    )
+
+
+_factories: Dict[Language, Callable[[Language], Tokenizer]] = {}
+
+
+def register_tokenizer(language: Language, factory: Callable[[Language], Tokenizer]) -> None:
+    """
+    Use `factory` instead of `default_tokenizer` for `language`.
+    """
+    _factories[language] = factory
+    get_tokenizer.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(language: Language) -> Tokenizer:
+    """
+    Built once per language and cached for the life of the process.
+    """
+    return _factories.get(language, default_tokenizer)(language)
@@ -1,29 +1,262 @@
-from typing import Dict
+import base64
+import heapq
+import json
+from collections import OrderedDict
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Set, Tuple
 from threading import Lock
-from .schemas import Job, JobStatus
+from .compression import Codec, available_encodings
+from .schemas import Article, Job, JobStatus, Language
+
+# Jobs are ordered by (created_at, id); every index is a sorted list of these keys
+JobKey = Tuple[datetime, str]
+
+
+def _job_key(job: Job) -> JobKey:
+    return (job.created_at, job.id)
+
+
+def _normalize_topic(topic: str) -> str:
+    return topic.strip().lower()
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def encode_cursor(key: JobKey) -> str:
+    raw = f"{key[0].isoformat()}|{key[1]}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> JobKey:
+    try:
+        created_at, _, job_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").partition("|")
+        return (_as_utc(datetime.fromisoformat(created_at)), job_id)
+    except ValueError as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _iter_desc(keys: List[JobKey], before: JobKey | None) -> Iterator[JobKey]:
+    """
+    Newest-first walk over a sorted key list, starting strictly below `before`.
+    """
+    end = len(keys) if before is None else bisect_left(keys, before)
+    for i in range(end - 1, -1, -1):
+        yield keys[i]
 
 
 class JobStore:
-    def __init__(self) -> None:
+    def __init__(self, codec: Codec | None = None, response_cache_size: int = 1024, max_profiles: int = 100) -> None:
+        # Job metadata (status, error, ...); `article` is always None here
         self._jobs: Dict[str, Job] = {}
+        # Articles are kept compressed in their compact fragment form (see
+        # Article.to_storage) and only decoded when a caller asks
+        self._articles: Dict[str, bytes] = {}
+        # Compressed pstats dumps for the most recent `max_profiles` profiled jobs
+        self._profiles: "OrderedDict[str, bytes]" = OrderedDict()
+        self._max_profiles = max_profiles
+        self._profiles_skipped: Set[str] = set()  # asked for a profile but the profiler was busy
+        self._codec = codec or Codec()
         self._lock = Lock()
 
+        # Recently served full-job response bodies, keyed by (job_id, encoding),
+        # so popular jobs are not re-serialized and re-compressed per request
+        self._response_codecs = {e: Codec(e) for e in available_encodings()}
+        self._responses: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._response_cache_size = response_cache_size
+
+        # Secondary indexes, kept in sync on create/update_status
+        self._by_created: List[JobKey] = []
+        self._by_status: Dict[JobStatus, List[JobKey]] = {}
+        self._by_language: Dict[Language, List[JobKey]] = {}
+        self._by_topic: Dict[str, List[JobKey]] = {}
+        self._topics: List[str] = []  # sorted distinct normalized topics, for prefix lookups
+
+    @property
+    def response_encodings(self) -> List[str]:
+        return list(self._response_codecs)
+
     def create(self, job: Job) -> Job:
         with self._lock:
             self._jobs[job.id] = job
+            key = _job_key(job)
+            insort(self._by_created, key)
+            insort(self._by_status.setdefault(job.status, []), key)
+            insort(self._by_language.setdefault(job.language, []), key)
+
+            topic = _normalize_topic(job.topic)
+            if topic not in self._by_topic:
+                insort(self._topics, topic)
+            insort(self._by_topic.setdefault(topic, []), key)
         return job
 
     def update_status(self, job_id: str, status: JobStatus, error_message: str | None = None) -> None:
         with self._lock:
             job = self._jobs[job_id]
+            if job.status != status:
+                key = _job_key(job)
+                old = self._by_status[job.status]
+                del old[bisect_left(old, key)]
+                insort(self._by_status.setdefault(status, []), key)
+
             job.status = status
             job.error_message = error_message
+            self._drop_responses(job_id)
 
-    def save_article(self, job_id: str, article) -> None:
+    def save_article(self, job_id: str, article: Article) -> None:
+        # Compress outside the lock; the article is encoded exactly once
+        encoded = self._codec.compress(json.dumps(article.to_storage()).encode("utf-8"))
         with self._lock:
-            job = self._jobs[job_id]
-            job.article = article
+            self._articles[job_id] = encoded
+            self._drop_responses(job_id)
 
     def get(self, job_id: str) -> Job | None:
         with self._lock:
-            return self._jobs.get(job_id)
+            job = self._jobs.get(job_id)
+            encoded = self._articles.get(job_id)
+            if job is not None:
+                job = job.model_copy()
+        if job is None or encoded is None:
+            return job
+        # Decompress outside the lock; only callers that need the article pay for it
+        job.article = Article.model_validate(json.loads(self._codec.decompress(encoded)))
+        return job
+
+    def exists(self, job_id: str) -> bool:
+        with self._lock:
+            return job_id in self._jobs
+
+    def get_encoded(self, job_id: str, encoding: str) -> bytes | None:
+        """
+        Full job JSON compressed with `encoding` (one of `response_encodings`),
+        or None if the job has no article yet. Built once and then served from
+        a small LRU cache.
+        """
+        key = (job_id, encoding)
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+                return cached
+            if job_id not in self._articles:
+                return None
+
+        job = self.get(job_id)
+        if job is None:
+            return None
+        body = self._response_codecs[encoding].compress(job.model_dump_json().encode("utf-8"))
+
+        with self._lock:
+            # Don't cache a body whose status changed while it was being built
+            if self._jobs[job_id].status != job.status:
+                return body
+            self._responses[key] = body
+            while len(self._responses) > self._response_cache_size:
+                self._responses.popitem(last=False)
+        return body
+
+    def save_profile(self, job_id: str, stats: bytes) -> None:
+        # Raw dumps are ~10x the size of a compressed article; keep them
+        # compressed and drop the oldest once over the cap
+        encoded = self._codec.compress(stats)
+        with self._lock:
+            self._profiles[job_id] = encoded
+            while len(self._profiles) > self._max_profiles:
+                self._profiles.popitem(last=False)
+
+    def skip_profile(self, job_id: str) -> None:
+        with self._lock:
+            self._profiles_skipped.add(job_id)
+
+    def profile_skipped(self, job_id: str) -> bool:
+        with self._lock:
+            return job_id in self._profiles_skipped
+
+    def get_profile(self, job_id: str) -> bytes | None:
+        with self._lock:
+            encoded = self._profiles.get(job_id)
+        return self._codec.decompress(encoded) if encoded is not None else None
+
+    def list(
+        self,
+        status: JobStatus | None = None,
+        topic_prefix: str | None = None,
+        language: Language | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Tuple[List[Job], str | None]:
+        """
+        Newest-first page of jobs (without articles) plus the cursor for the
+        next page. The smallest matching secondary index drives the walk and
+        the remaining filters are checked per job, so cost follows the page
+        size and the most selective filter rather than the total number of jobs.
+        """
+        before = decode_cursor(cursor) if cursor else None
+        if created_after is not None:
+            created_after = _as_utc(created_after)
+        if created_before is not None:
+            bound = (_as_utc(created_before), "")
+            before = bound if before is None else min(before, bound)
+
+        with self._lock:
+            candidates = self._candidates(status, topic_prefix, language, before)
+
+            items: List[Job] = []
+            next_cursor = None
+            for key in candidates:
+                if created_after is not None and key[0] < created_after:
+                    break
+                job = self._jobs[key[1]]
+                if status is not None and job.status != status:
+                    continue
+                if language is not None and job.language != language:
+                    continue
+                if topic_prefix and not _normalize_topic(job.topic).startswith(_normalize_topic(topic_prefix)):
+                    continue
+                if len(items) == limit:
+                    next_cursor = encode_cursor(_job_key(items[-1]))
+                    break
+                items.append(job.model_copy())
+
+        return items, next_cursor
+
+    def _candidates(
+        self,
+        status: JobStatus | None,
+        topic_prefix: str | None,
+        language: Language | None,
+        before: JobKey | None,
+    ) -> Iterator[JobKey]:
+        # Walk whichever filtered index has the fewest entries; the other
+        # filters are then checked per job on a short list.
+        sources: List[Tuple[int, Iterator[JobKey]]] = []
+        if status is not None:
+            keys = self._by_status.get(status, [])
+            sources.append((len(keys), _iter_desc(keys, before)))
+
+        if language is not None:
+            keys = self._by_language.get(language, [])
+            sources.append((len(keys), _iter_desc(keys, before)))
+
+        if topic_prefix:
+            prefix = _normalize_topic(topic_prefix)
+            lo = bisect_left(self._topics, prefix)
+            hi = bisect_right(self._topics, prefix + "\U0010ffff")
+            topic_lists = [self._by_topic[t] for t in self._topics[lo:hi]]
+            sources.append((
+                sum(len(keys) for keys in topic_lists),
+                heapq.merge(*(_iter_desc(keys, before) for keys in topic_lists), reverse=True),
+            ))
+
+        if not sources:
+            return _iter_desc(self._by_created, before)
+        return min(sources, key=lambda source: source[0])[1]
+
+    def _drop_responses(self, job_id: str) -> None:
+        # Cached bodies embed the status; callers hold the lock
+        for encoding in self._response_codecs:
+            self._responses.pop((job_id, encoding), None)
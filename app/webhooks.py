@@ -0,0 +1,380 @@
+import hashlib
+import hmac
+import http.client
+import ipaddress
+import json
+import logging
+import socket
+import sqlite3
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import defaultdict
+from functools import partial
+from threading import Event, Lock, Thread
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+from urllib.parse import urlsplit
+
+from .schemas import Job
+
+logger = logging.getLogger(__name__)
+
+# Batches' worth of due events read from the outbox per delivery pass
+_WINDOW_BATCHES = 10
+
+
+def sign(secret: str, timestamp: str, body: bytes) -> str:
+    """
+    HMAC-SHA256 over "<timestamp>.<body>". Receivers recompute it to verify
+    the `X-Webhook-Signature` header and reject stale timestamps.
+    """
+    message = timestamp.encode("ascii") + b"." + body
+    return "sha256=" + hmac.new(secret.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
+def _public_addresses(host: str, port: int) -> List[Tuple[str, int]]:
+    """
+    Resolve `host` and return its (address, port) pairs, raising ValueError
+    unless every address is public.
+    """
+    try:
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        raise ValueError(f"Callback host {host!r} does not resolve") from e
+
+    addresses = []
+    for info in infos:
+        address = ipaddress.ip_address(info[4][0].split("%")[0])
+        if not address.is_global or address.is_multicast:
+            raise ValueError(f"Callback host {host!r} resolves to non-public address {address}")
+        addresses.append((info[4][0], port))
+    return addresses
+
+
+def validate_callback_url(url: str, allowed_hosts: Iterable[str] = ()) -> None:
+    """
+    Raise ValueError unless `url` is http(s) and every address its host
+    resolves to is public. Hosts in `allowed_hosts` skip the address check
+    (e.g. an internal CMS). This blocks callbacks aimed at loopback, private,
+    link-local (cloud metadata) and other non-public addresses.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError("Callback URL must be an absolute http(s) URL")
+
+    host = parts.hostname.lower()
+    if host in allowed_hosts:
+        return
+    _public_addresses(host, parts.port or (443 if parts.scheme == "https" else 80))
+
+
+def _checked_create_connection(allowed_hosts: FrozenSet[str]):
+    """
+    Replacement for `socket.create_connection` that resolves the host once,
+    checks the addresses and connects to exactly those, so DNS can't change
+    between the check and the connection.
+    """
+
+    def create_connection(address, timeout=socket._GLOBAL_DEFAULT_TIMEOUT, source_address=None):
+        host, port = address
+        if host.lower() in allowed_hosts:
+            return socket.create_connection(address, timeout, source_address)
+
+        error: OSError | None = None
+        for resolved in _public_addresses(host, port):
+            try:
+                return socket.create_connection(resolved, timeout, source_address)
+            except OSError as e:
+                error = e
+        raise error or OSError(f"Could not connect to {host!r}")
+
+    return create_connection
+
+
+class _CheckedHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, *args, allowed_hosts: FrozenSet[str], **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._create_connection = _checked_create_connection(allowed_hosts)
+
+
+class _CheckedHTTPSConnection(http.client.HTTPSConnection):
+    def __init__(self, *args, allowed_hosts: FrozenSet[str], **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # TLS still verifies against the hostname; only the TCP target is pinned
+        self._create_connection = _checked_create_connection(allowed_hosts)
+
+
+class _CheckedHTTPHandler(urllib.request.HTTPHandler):
+    def __init__(self, allowed_hosts: FrozenSet[str]) -> None:
+        super().__init__()
+        self._allowed_hosts = allowed_hosts
+
+    def http_open(self, req):
+        return self.do_open(partial(_CheckedHTTPConnection, allowed_hosts=self._allowed_hosts), req)
+
+
+class _CheckedHTTPSHandler(urllib.request.HTTPSHandler):
+    def __init__(self, allowed_hosts: FrozenSet[str]) -> None:
+        super().__init__()
+        self._allowed_hosts = allowed_hosts
+
+    def https_open(self, req):
+        return self.do_open(
+            partial(_CheckedHTTPSConnection, allowed_hosts=self._allowed_hosts), req, context=self._context
+        )
+
+
+def _build_opener(allowed_hosts: FrozenSet[str]) -> urllib.request.OpenerDirector:
+    """
+    Opener for webhook delivery: checked connections, no proxies and no
+    redirect handling, so a 3xx surfaces as an HTTPError (a failed attempt)
+    instead of being followed to an unchecked Location.
+    """
+    opener = urllib.request.OpenerDirector()
+    for handler in (
+        _CheckedHTTPHandler(allowed_hosts),
+        _CheckedHTTPSHandler(allowed_hosts),
+        urllib.request.UnknownHandler(),
+        urllib.request.HTTPDefaultErrorHandler(),
+        urllib.request.HTTPErrorProcessor(),
+    ):
+        opener.add_handler(handler)
+    return opener
+
+
+class WebhookDispatcher:
+    """
+    Delivers job completion events to callback URLs from a background thread.
+
+    Events are written to a SQLite outbox before delivery, so anything not yet
+    delivered survives a restart. Due events are grouped per endpoint and sent
+    in batches; failed batches are retried with exponential backoff and
+    dropped after `max_attempts`.
+
+    Without a secret the dispatcher is disabled: it opens no outbox, never
+    sends unsigned (or empty-key signed) requests, and callers should reject
+    callback URLs.
+    """
+
+    def __init__(
+        self,
+        outbox_path: str,
+        secret: str,
+        allowed_hosts: Iterable[str] = (),
+        batch_size: int = 50,
+        max_attempts: int = 8,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        timeout: float = 5.0,
+    ) -> None:
+        self._secret = secret
+        self._allowed_hosts = frozenset(h.strip().lower() for h in allowed_hosts if h.strip())
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._timeout = timeout
+
+        self._db_lock = Lock()
+        self._db: sqlite3.Connection | None = None
+        self._opener = _build_opener(self._allowed_hosts)
+
+        self._wake = Event()
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self._start_lock = Lock()
+        self._stopped = False
+
+        if not self.enabled:
+            # Webhooks are optional; don't create an outbox nobody will use
+            logger.info("WEBHOOK_SECRET is not set; webhook delivery is disabled")
+            return
+
+        self._db = sqlite3.connect(outbox_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " url TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " next_attempt_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS outbox_due ON outbox (next_attempt_at)")
+        self._db.commit()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._secret)
+
+    def validate(self, url: str) -> None:
+        """
+        Raise ValueError if `url` can't be used as a callback target.
+        """
+        if not self.enabled:
+            raise ValueError("Webhooks are not configured on this server")
+        validate_callback_url(url, self._allowed_hosts)
+
+    def start(self) -> None:
+        with self._start_lock:
+            if not self.enabled or self._stopped:
+                return
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, name="webhook-dispatcher", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the delivery thread and close the outbox. Undelivered events stay
+        in the outbox for the next process; the dispatcher can't be restarted.
+        """
+        with self._start_lock:
+            self._stopped = True
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._timeout + 1)
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+
+    def notify(self, job: Job) -> None:
+        """
+        Queue a `job.<status>` event for the job's callback URL, if it has one.
+        """
+        if job.callback_url is None:
+            return
+        if not self.enabled:
+            logger.warning("Dropping webhook for job %s: WEBHOOK_SECRET is not set", job.id)
+            return
+
+        event = {
+            "id": str(uuid.uuid4()),
+            "type": f"job.{job.status.value}",
+            "job_id": job.id,
+            "topic": job.topic,
+            "status": job.status.value,
+            "error_message": job.error_message,
+        }
+        with self._db_lock:
+            if self._stopped:
+                # The outbox is closed; don't silently restart the dispatcher
+                logger.error("Dropping webhook for job %s: dispatcher is stopped", job.id)
+                return
+            self._db.execute(
+                "INSERT INTO outbox (url, payload, next_attempt_at) VALUES (?, ?, ?)",
+                (str(job.callback_url), json.dumps(event), time.time()),
+            )
+            self._db.commit()
+
+        self.start()
+        self._wake.set()
+
+    def pending(self) -> int:
+        if self._db is None:
+            return 0
+        with self._db_lock:
+            return self._db.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def deliver_due(self) -> float:
+        """
+        Send due events, oldest first, in batches of up to `batch_size` per
+        endpoint. Each call reads a bounded window of the outbox, so a large
+        backlog is drained window by window. Returns seconds until the next
+        event is due (capped at `max_delay`).
+        """
+        if self._db is None:
+            return self._max_delay
+
+        now = time.time()
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT id, url, payload, attempts FROM outbox WHERE next_attempt_at <= ?"
+                " ORDER BY next_attempt_at, id LIMIT ?",
+                (now, self._batch_size * _WINDOW_BATCHES),
+            ).fetchall()
+
+        pending: Dict[str, List[Tuple[int, str, int]]] = defaultdict(list)
+        for event_id, url, payload, attempts in rows:
+            pending[url].append((event_id, payload, attempts))
+
+        for url, events in pending.items():
+            events.sort()
+            for start in range(0, len(events), self._batch_size):
+                batch = events[start:start + self._batch_size]
+                if self._post(url, [payload for _, payload, _ in batch]):
+                    self._delete([event_id for event_id, _, _ in batch])
+                    continue
+                # Back the whole endpoint off rather than hammering it with
+                # the rest of its window; every event left counts an attempt
+                self._reschedule(url, events[start:])
+                break
+
+        with self._db_lock:
+            next_due = self._db.execute("SELECT MIN(next_attempt_at) FROM outbox").fetchone()[0]
+        if next_due is None:
+            return self._max_delay
+        return max(0.0, min(next_due - time.time(), self._max_delay))
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                delay = self.deliver_due()
+            except Exception:  # noqa
+                logger.exception("Webhook delivery loop failed")
+                delay = self._base_delay
+            self._wake.wait(timeout=delay)
+            self._wake.clear()
+
+    def _post(self, url: str, payloads: List[str]) -> bool:
+        body = ('{"events": [' + ", ".join(payloads) + "]}").encode("utf-8")
+        timestamp = str(int(time.time()))
+        request = urllib.request.Request(
+            url,
+            data=body,
+            method="POST",
+            headers={
+                "Content-Type": "application/json",
+                "X-Webhook-Timestamp": timestamp,
+                "X-Webhook-Signature": sign(self._secret, timestamp, body),
+            },
+        )
+        try:
+            # The target is checked when connecting (see _build_opener), and
+            # redirects are not followed; a 3xx raises HTTPError
+            with self._opener.open(request, timeout=self._timeout) as response:
+                return 200 <= response.status < 300
+        except ValueError as e:
+            logger.warning("Not delivering webhook to %s: %s", url, e)
+            return False
+        except (urllib.error.URLError, OSError) as e:
+            logger.warning("Webhook delivery to %s failed: %s", url, e)
+            return False
+
+    def _delete(self, event_ids: List[int]) -> None:
+        with self._db_lock:
+            self._db.executemany("DELETE FROM outbox WHERE id = ?", [(i,) for i in event_ids])
+            self._db.commit()
+
+    def _reschedule(self, url: str, batch: List[Tuple[int, str, int]]) -> None:
+        dropped: List[int] = []
+        retries: List[Tuple[float, int]] = []
+        now = time.time()
+        for event_id, _, attempts in batch:
+            attempts += 1
+            if attempts >= self._max_attempts:
+                dropped.append(event_id)
+            else:
+                delay = min(self._base_delay * 2 ** (attempts - 1), self._max_delay)
+                retries.append((now + delay, event_id))
+
+        if dropped:
+            logger.error("Dropping %d webhook event(s) for %s after %d attempts", len(dropped), url, self._max_attempts)
+            self._delete(dropped)
+
+        with self._db_lock:
+            self._db.executemany(
+                "UPDATE outbox SET attempts = attempts + 1, next_attempt_at = ? WHERE id = ?",
+                retries,
+            )
+            self._db.commit()
@@ -1,9 +1,19 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 import streamlit as st
 
 API_BASE_URL = "http://localhost:8000/api"
 
+MAX_CONCURRENT_JOBS = 8
+
+# Polling backoff: start fast, double up to a ceiling
+POLL_INITIAL_DELAY = 0.5
+POLL_MAX_DELAY = 8.0
+POLL_TICK = 0.5  # how often the progress view wakes up to check which jobs are due
+
 st.set_page_config(
     page_title="SEO Article Generator (API)",
     layout="wide",
@@ -17,8 +27,8 @@ st.caption("This UI calls the FastAPI backend using HTTP")
 # -----------------------------
 st.sidebar.header("Article Settings")
 
-topic = st.sidebar.text_input(
-    "Topic / Primary Keyword",
+topics_text = st.sidebar.text_area(
+    "Topics / Primary Keywords (one per line)",
     value="best productivity tools for remote teams",
 )
 
@@ -32,15 +42,41 @@ target_word_count = st.sidebar.slider(
 
 language = st.sidebar.selectbox(
     "Language",
-    options=["en"],
+    options=["en", "de", "fr", "es"],
     index=0,
 )
 
-generate_btn = st.sidebar.button("Generate Article")
+generate_btn = st.sidebar.button("Generate Articles")
+
+# Tracked jobs: job_id -> {"topic", "status", "error_message", "delay", "next_poll"}
+# status is the backend's, or "lost" if the backend no longer knows the job
+if "jobs" not in st.session_state:
+    st.session_state.jobs = {}
+
 
 # -----------------------------
 # Helper Functions
 # -----------------------------
+@st.cache_resource
+def get_session() -> requests.Session:
+    # One pooled session per server process, reused across reruns and users
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENT_JOBS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=MAX_CONCURRENT_JOBS)
+
+
+# Resolved on the script thread; worker threads only use the objects
+session = get_session()
+executor = get_executor()
+
+
 def create_job(topic: str, target_word_count: int, language: str):
     payload = {
         "topic": topic,
@@ -48,133 +84,291 @@ def create_job(topic: str, target_word_count: int, language: str):
         "language": language,
     }
 
-    response = requests.post(f"{API_BASE_URL}/jobs", json=payload)
+    response = session.post(f"{API_BASE_URL}/jobs", json=payload)
     response.raise_for_status()
     return response.json()
 
 
 def get_job(job_id: str):
-    response = requests.get(f"{API_BASE_URL}/jobs/{job_id}")
+    response = session.get(f"{API_BASE_URL}/jobs/{job_id}")
     response.raise_for_status()
     return response.json()
 
 
+@st.cache_data(show_spinner=False)
+def get_completed_job(job_id: str, _job_data: dict | None = None):
+    # Completed jobs never change, so each one is downloaded once. The poll
+    # that sees "completed" passes its response in to seed the cache
+    # (underscore parameters are not part of the cache key).
+    return _job_data if _job_data is not None else get_job(job_id)
+
+
+def try_create_job(topic: str, target_word_count: int, language: str):
+    """
+    Create one job without raising, so one rejected topic can't stop the rest.
+    Returns (job, None) or (None, exception).
+    """
+    try:
+        return create_job(topic, target_word_count, language), None
+    except requests.exceptions.RequestException as e:
+        return None, e
+
+
+def describe_error(error: Exception) -> str:
+    # Prefer the API's own message (e.g. a 400/422 "detail") over the HTTP status line
+    response = getattr(error, "response", None)
+    if response is not None:
+        try:
+            detail = response.json().get("detail")
+        except ValueError:
+            detail = None
+        if detail:
+            return f"{response.status_code}: {detail}"
+    return str(error)
+
+
+def submit_jobs(topics: list[str], target_word_count: int, language: str) -> list[tuple[str, Exception]]:
+    """
+    Create a job per topic concurrently and track every one that was created.
+    Returns (topic, error) for each topic that could not be submitted.
+    """
+    results = executor.map(lambda t: try_create_job(t, target_word_count, language), topics)
+    now = time.monotonic()
+    failures = []
+    for topic, (job, error) in zip(topics, results):
+        if error is not None:
+            failures.append((topic, error))
+            continue
+        st.session_state.jobs[job["id"]] = {
+            "topic": topic,
+            "status": job["status"],
+            "error_message": None,
+            "delay": POLL_INITIAL_DELAY,
+            "next_poll": now + POLL_INITIAL_DELAY,
+        }
+    return failures
+
+
+def fetch_status(job_id: str):
+    """
+    Poll one job without raising, so one bad response can't stop the others.
+    Returns (job_data, None) or (None, exception).
+    """
+    try:
+        return get_job(job_id), None
+    except requests.exceptions.RequestException as e:
+        return None, e
+
+
+def is_active(info: dict) -> bool:
+    return info["status"] in ("pending", "running")
+
+
+def poll_due_jobs() -> bool:
+    """
+    Poll every active job whose backoff delay has elapsed, concurrently.
+    Returns True if any job reached a final state.
+    """
+    now = time.monotonic()
+    due = [
+        job_id
+        for job_id, info in st.session_state.jobs.items()
+        if is_active(info) and info["next_poll"] <= now
+    ]
+    if not due:
+        return False
+
+    finished = False
+    for job_id, (job_data, error) in zip(due, executor.map(fetch_status, due)):
+        info = st.session_state.jobs[job_id]
+
+        if error is not None:
+            response = getattr(error, "response", None)
+            if response is not None and response.status_code == 404:
+                # The backend store is in memory; a restart forgets every job
+                info["status"] = "lost"
+                info["error_message"] = "Job no longer exists on the backend (was it restarted?)"
+                finished = True
+                continue
+            info["error_message"] = f"Polling failed: {error}"
+        else:
+            info["status"] = job_data["status"]
+            info["error_message"] = job_data.get("error_message")
+            if info["status"] == "completed":
+                get_completed_job(job_id, job_data)
+            if not is_active(info):
+                finished = True
+                continue
+
+        info["delay"] = min(info["delay"] * 2, POLL_MAX_DELAY)
+        info["next_poll"] = time.monotonic() + info["delay"]
+    return finished
+
+
+def render_progress() -> None:
+    jobs = st.session_state.jobs
+    st.subheader("Progress")
+    done = sum(not is_active(info) for info in jobs.values())
+    st.progress(done / len(jobs), text=f"{done} / {len(jobs)} jobs finished")
+    st.dataframe(
+        [
+            {
+                "Topic": info["topic"],
+                "Status": info["status"],
+                "Error": info["error_message"] or "",
+                "Job ID": job_id,
+            }
+            for job_id, info in jobs.items()
+        ],
+        width="stretch",
+        hide_index=True,
+    )
+
+
+@st.fragment(run_every=POLL_TICK)
+def watch_progress() -> None:
+    # Runs on its own timer, so polling never blocks or re-renders the article view.
+    # Only used while jobs are active; afterwards the table is rendered statically.
+    try:
+        finished = poll_due_jobs()
+    except Exception as e:
+        st.error(f"Unexpected error while polling: {e}")
+        return
+
+    render_progress()
+
+    if finished:
+        # Refresh the whole page so newly completed articles become selectable
+        # and the timer stops once nothing is active
+        st.rerun(scope="app")
+
+
+def render_article(job_data: dict) -> None:
+    article = job_data["article"]
+    seo = article["seo"]
+
+    # -----------------------------
+    # SEO Metadata
+    # -----------------------------
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("SEO Metadata")
+        st.write("**Title tag:**")
+        st.code(seo["title_tag"])
+
+        st.write("**Meta description:**")
+        st.write(seo["meta_description"])
+
+        st.write("**Primary Keyword:**")
+        st.code(seo["keyword_analysis"]["primary_keyword"])
+
+        st.write("**Secondary Keywords:**")
+        for kw in seo["keyword_analysis"]["secondary_keywords"]:
+            st.write(f"- {kw}")
+
+    with col2:
+        st.subheader("Quality Score")
+        score = seo["quality_score"]
+        st.metric("Overall Score", str(score["overall_score"]))
+        st.write(f"✅ Primary in title: {score['has_primary_in_title']}")
+        st.write(f"✅ Primary in intro: {score['has_primary_in_intro']}")
+        st.write(f"✅ Heading structure OK: {score['heading_structure_ok']}")
+        st.write(
+            f"✅ Meets word count: {score['meets_word_count']} (Actual: {article['word_count']})"
+        )
+
+    st.markdown("---")
+
+    # -----------------------------
+    # Internal & External Links
+    # -----------------------------
+    col3, col4 = st.columns(2)
+
+    with col3:
+        st.subheader("Internal Linking Suggestions")
+        for link in seo["internal_links"]:
+            st.write(f"- **{link['anchor_text']}** → `{link['target_slug']}`")
+
+    with col4:
+        st.subheader("External References")
+        for ref in seo["external_references"]:
+            st.write(
+                f"- [{ref['title']}]({ref['url']}) — _{ref['suggested_position']}_"
+            )
+
+    st.markdown("---")
+
+    # -----------------------------
+    # FAQ Section
+    # -----------------------------
+    st.subheader("FAQ")
+    for faq in seo["faq"]:
+        with st.expander(faq["question"]):
+            st.write(faq["answer"])
+
+    st.markdown("---")
+
+    # -----------------------------
+    # Full Article
+    # -----------------------------
+    st.subheader("Generated Article")
+    st.markdown(f"# {article['h1']}")
+    st.markdown(article["body_markdown"])
+
+    # -----------------------------
+    # Structured Data Preview
+    # -----------------------------
+    st.markdown("---")
+    st.subheader("Structured Data (JSON-LD)")
+    st.json(seo["structured_data"])
+
+
 # -----------------------------
 # Main Logic
 # -----------------------------
 if generate_btn:
-    if not topic.strip():
-        st.warning("Please enter a topic.")
+    topics = [t.strip() for t in topics_text.splitlines() if t.strip()]
+    if not topics:
+        st.warning("Please enter at least one topic.")
     else:
-        st.info("Sending job to FastAPI backend...")
-
-        try:
-            job = create_job(topic, target_word_count, language)
-            job_id = job["id"]
-
-            st.success(f"Job created → ID: {job_id}")
-
-            with st.spinner("AI agent is analyzing SERP and generating content..."):
-                while True:
-                    job_data = get_job(job_id)
-
-                    if job_data["status"] == "completed":
-                        break
-                    elif job_data["status"] == "failed":
-                        st.error(f"Job failed: {job_data.get('error_message')}")
-                        st.stop()
-
-                    time.sleep(1.5)  # Poll every 1.5s
-
-            st.success("Article generation completed!")
-
-            article = job_data["article"]
-            seo = article["seo"]
-
-            # -----------------------------
-            # SEO Metadata
-            # -----------------------------
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.subheader("SEO Metadata")
-                st.write("**Title tag:**")
-                st.code(seo["title_tag"])
-
-                st.write("**Meta description:**")
-                st.write(seo["meta_description"])
-
-                st.write("**Primary Keyword:**")
-                st.code(seo["keyword_analysis"]["primary_keyword"])
-
-                st.write("**Secondary Keywords:**")
-                for kw in seo["keyword_analysis"]["secondary_keywords"]:
-                    st.write(f"- {kw}")
-
-            with col2:
-                st.subheader("Quality Score")
-                score = seo["quality_score"]
-                st.metric("Overall Score", str(score["overall_score"]))
-                st.write(f"✅ Primary in title: {score['has_primary_in_title']}")
-                st.write(f"✅ Primary in intro: {score['has_primary_in_intro']}")
-                st.write(f"✅ Heading structure OK: {score['heading_structure_ok']}")
-                st.write(
-                    f"✅ Meets word count: {score['meets_word_count']} (Actual: {article['word_count']})"
-                )
-
-            st.markdown("---")
-
-            # -----------------------------
-            # Internal & External Links
-            # -----------------------------
-            col3, col4 = st.columns(2)
-
-            with col3:
-                st.subheader("Internal Linking Suggestions")
-                for link in seo["internal_links"]:
-                    st.write(f"- **{link['anchor_text']}** → `{link['target_slug']}`")
-
-            with col4:
-                st.subheader("External References")
-                for ref in seo["external_references"]:
-                    st.write(
-                        f"- [{ref['title']}]({ref['url']}) — _{ref['suggested_position']}_"
-                    )
-
-            st.markdown("---")
-
-            # -----------------------------
-            # FAQ Section
-            # -----------------------------
-            st.subheader("FAQ")
-            for faq in seo["faq"]:
-                with st.expander(faq["question"]):
-                    st.write(faq["answer"])
-
-            st.markdown("---")
-
-            # -----------------------------
-            # Full Article
-            # -----------------------------
-            st.subheader("Generated Article")
-            st.markdown(f"# {article['h1']}")
-            st.markdown(article["body_markdown"])
-
-            # -----------------------------
-            # Structured Data Preview
-            # -----------------------------
-            st.markdown("---")
-            st.subheader("Structured Data (JSON-LD)")
-            st.json(seo["structured_data"])
-
-        except requests.exceptions.ConnectionError:
+        failures = submit_jobs(topics, target_word_count, language)
+        submitted = len(topics) - len(failures)
+        if submitted:
+            st.success(f"Submitted {submitted} job(s) to the FastAPI backend.")
+        if failures and all(isinstance(e, requests.exceptions.ConnectionError) for _, e in failures):
             st.error(
                 "❌ Could not connect to FastAPI backend.\n\n"
                 "Make sure FastAPI is running on:\n"
                 "http://localhost:8000"
             )
-        except Exception as e:
-            st.error(f"Unexpected error: {e}")
+        else:
+            for topic, error in failures:
+                st.error(f"Could not submit '{topic}': {describe_error(error)}")
 
+if not st.session_state.jobs:
+    st.info("Enter one or more topics in the sidebar and click **Generate Articles**.")
 else:
-    st.info("Enter a topic in the sidebar and click **Generate Article**.")
+    if any(is_active(info) for info in st.session_state.jobs.values()):
+        watch_progress()
+    else:
+        render_progress()
+
+    completed = {
+        job_id: info["topic"]
+        for job_id, info in st.session_state.jobs.items()
+        if info["status"] == "completed"
+    }
+    if completed:
+        st.markdown("---")
+        selected = st.selectbox(
+            "Show article",
+            options=list(completed),
+            format_func=lambda job_id: completed[job_id],
+        )
+        try:
+            render_article(get_completed_job(selected))
+        except requests.exceptions.ConnectionError:
+            st.error("❌ Could not connect to FastAPI backend.")
+        except Exception as e:
+            st.error(f"Could not load article: {e}")
@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# Keep the webhook outbox created by the app's container out of the working tree
+os.environ.setdefault("WEBHOOK_OUTBOX_PATH", os.path.join(tempfile.mkdtemp(), "webhook_outbox.sqlite3"))
@@ -0,0 +1,90 @@
+import pstats
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app import api
+from app.main import app
+from app.profiling import profiled
+from app.schemas import JobStatus
+from app.store import JobStore
+
+
+def test_profiled_job_exposes_pstats(monkeypatch, tmp_path: Path):
+    store = JobStore()
+    monkeypatch.setitem(app.dependency_overrides, api.get_job_store, lambda: store)
+    client = TestClient(app)
+
+    job = client.post("/api/jobs", json={"topic": "remote onboarding", "profile": True}).json()
+    assert job["profile"] is True
+
+    response = client.get(f"/api/jobs/{job['id']}/profile")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/octet-stream"
+
+    path = tmp_path / "job.pstats"
+    path.write_bytes(response.content)
+    functions = {func_name for (_, _, func_name) in pstats.Stats(str(path)).stats}
+    assert "generate_article" in functions
+
+
+def test_unprofiled_job_has_no_profile(monkeypatch):
+    store = JobStore()
+    monkeypatch.setitem(app.dependency_overrides, api.get_job_store, lambda: store)
+    client = TestClient(app)
+
+    job = client.post("/api/jobs", json={"topic": "remote onboarding"}).json()
+    assert client.get(f"/api/jobs/{job['id']}").json()["status"] == "completed"
+
+    response = client.get(f"/api/jobs/{job['id']}/profile")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Profile not available"
+    assert client.get("/api/jobs/missing/profile").json()["detail"] == "Job not found"
+
+
+class _CheckingStore(JobStore):
+    """
+    Records whether the profile was already saved when the job completed.
+    """
+
+    profile_at_completion = None
+
+    def update_status(self, job_id, status, error_message=None):
+        if status == JobStatus.completed:
+            self.profile_at_completion = self.get_profile(job_id)
+        super().update_status(job_id, status, error_message)
+
+
+def test_profile_is_saved_before_job_completes(monkeypatch):
+    store = _CheckingStore()
+    monkeypatch.setitem(app.dependency_overrides, api.get_job_store, lambda: store)
+    client = TestClient(app)
+
+    client.post("/api/jobs", json={"topic": "remote onboarding", "profile": True})
+    assert store.profile_at_completion is not None
+
+
+def test_busy_profiler_runs_job_unprofiled(monkeypatch):
+    store = JobStore()
+    monkeypatch.setitem(app.dependency_overrides, api.get_job_store, lambda: store)
+    client = TestClient(app)
+
+    # Another job holds the profiler; this one must not wait for it
+    with profiled(lambda stats: None) as active:
+        assert active
+        job = client.post("/api/jobs", json={"topic": "remote onboarding", "profile": True}).json()
+
+    assert client.get(f"/api/jobs/{job['id']}").json()["status"] == "completed"
+    response = client.get(f"/api/jobs/{job['id']}/profile")
+    assert response.status_code == 404
+    assert "ran unprofiled" in response.json()["detail"]
+
+
+def test_profiles_are_compressed_and_capped():
+    store = JobStore(max_profiles=2)
+    for job_id in ("a", "b", "c"):
+        store.save_profile(job_id, b"stats-" + job_id.encode() * 1000)
+
+    assert store.get_profile("a") is None
+    assert store.get_profile("c") == b"stats-" + b"c" * 1000
+    assert len(store._profiles["c"]) < 1000
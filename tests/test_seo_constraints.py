@@ -1,7 +1,8 @@
-from app.schemas import SERPResult
+from app.schemas import Article, SERPResult
 from app.services.analyzer import SERPAnalyzer
 from app.services.outline_generator import OutlineGenerator
 from app.services.article_generator import ArticleGenerator
+from app.services.serp_client import SERPClient
 
 
 def test_article_meets_basic_seo_constraints():
@@ -32,3 +33,30 @@ def test_article_meets_basic_seo_constraints():
     assert article.seo.quality_score.has_primary_in_intro
     assert article.seo.quality_score.heading_structure_ok
     assert article.seo.quality_score.meets_word_count is True or article.word_count >= 0.8 * 800
+
+
+def test_article_body_is_shared_fragments_materialized_on_serialization():
+    topic = "best productivity tools for remote teams"
+    serp_results = SERPClient().fetch_top_results(topic=topic, limit=3)
+    analysis = SERPAnalyzer().analyze(topic=topic, serp_results=serp_results)
+    outline = OutlineGenerator().generate(topic=topic, analysis=analysis)
+    generator = ArticleGenerator()
+
+    first = generator.generate_article(outline=outline, analysis=analysis, target_word_count=800)
+    second = generator.generate_article(outline=outline, analysis=analysis, target_word_count=800)
+
+    # The bridge paragraph is the same fragment id in both articles, not a copy
+    first_bridge = first.body.sections[0].paragraphs[-1]
+    second_bridge = second.body.sections[0].paragraphs[-1]
+    assert first_bridge.parts == second_bridge.parts
+    assert all(isinstance(p, int) for p in first_bridge.parts)
+    assert not hasattr(first_bridge, "__dict__")
+
+    dumped = first.model_dump()
+    assert "body" not in dumped
+    assert dumped["body_markdown"].startswith(f"If you're looking for {topic}")
+    assert "## What Are Productivity Tools For Remote Teams?" in dumped["body_markdown"]
+
+    restored = Article.model_validate_json(first.model_dump_json())
+    assert restored == first
+    assert restored.body_markdown == first.body_markdown
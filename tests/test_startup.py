@@ -0,0 +1,77 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.container import ServiceContainer
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Generous ceilings: these catch regressions like heavy work moving back to
+# import time, not small fluctuations between machines.
+MAX_IMPORT_SECONDS = 3.0
+MAX_FIRST_REQUEST_SECONDS = 0.1
+
+
+def test_import_builds_no_services_and_is_fast():
+    script = (
+        "import time; start = time.perf_counter(); "
+        "import app.main; elapsed = time.perf_counter() - start; "
+        "from app.api import container, JobStore, SERPClient, SERPAnalyzer, OutlineGenerator, ArticleGenerator; "
+        "services = (JobStore, SERPClient, SERPAnalyzer, OutlineGenerator, ArticleGenerator); "
+        "print(elapsed, any(container.is_built(t) for t in services))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+    elapsed, any_built = float(out[0]), out[1]
+    assert any_built == "False"
+    assert elapsed < MAX_IMPORT_SECONDS
+
+
+def test_first_request_after_warm_up_is_fast(monkeypatch):
+    from app import api
+    from app.main import app
+
+    api.container.reset()
+    with TestClient(app) as client:  # runs the lifespan warm-up
+        # Stub the background generation so only request handling is timed
+        monkeypatch.setattr(api, "_run_pipeline", lambda *args: None)
+        start = time.perf_counter()
+        created = client.post("/api/jobs", json={"topic": "remote onboarding checklist"})
+        job = client.get(f"/api/jobs/{created.json()['id']}")
+        elapsed = time.perf_counter() - start
+
+    assert job.json()["status"] == "pending"
+    assert elapsed < MAX_FIRST_REQUEST_SECONDS
+
+
+def test_container_builds_once_and_calls_warm_up_hooks():
+    calls = []
+
+    class Service:
+        def __init__(self) -> None:
+            calls.append("init")
+
+        def warm_up(self) -> None:
+            calls.append("warm_up")
+
+    container = ServiceContainer()
+    container.register(Service)
+    assert not container.is_built(Service)
+
+    container.warm_up()
+    assert container.get(Service) is container.get(Service)
+    assert calls == ["init", "warm_up"]
+
+    Service.stop = lambda self: calls.append("stop")
+    container.reset()
+    assert calls == ["init", "warm_up", "stop"]
+    assert not container.is_built(Service)
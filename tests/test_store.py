@@ -0,0 +1,197 @@
+import gzip
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from app import api
+from app.compression import Codec, accepts_encoding, choose_encoding
+from app.main import app
+from app.schemas import Job, JobStatus, Language
+from app.services.analyzer import SERPAnalyzer
+from app.services.article_generator import ArticleGenerator
+from app.services.outline_generator import OutlineGenerator
+from app.services.serp_client import SERPClient
+from app.store import JobStore
+
+
+def _make_article(topic: str = "best productivity tools for remote teams"):
+    serp_results = SERPClient().fetch_top_results(topic=topic, limit=3)
+    analysis = SERPAnalyzer().analyze(topic=topic, serp_results=serp_results)
+    outline = OutlineGenerator().generate(topic=topic, analysis=analysis)
+    return ArticleGenerator().generate_article(outline=outline, analysis=analysis, target_word_count=800)
+
+
+def _make_job(job_id: str = "job-1", topic: str = "best productivity tools for remote teams", **kwargs) -> Job:
+    return Job(
+        id=job_id,
+        topic=topic,
+        target_word_count=800,
+        language=Language.en,
+        status=JobStatus.pending,
+        **kwargs,
+    )
+
+
+def test_article_is_stored_compressed_once_and_round_trips(monkeypatch):
+    codec = Codec(encoding="gzip")
+    compress_calls = []
+    original_compress = codec.compress
+    monkeypatch.setattr(codec, "compress", lambda data: compress_calls.append(data) or original_compress(data))
+
+    store = JobStore(codec=codec)
+    store.create(_make_job())
+    article = _make_article()
+
+    store.save_article("job-1", article)
+    store.update_status("job-1", JobStatus.completed)
+    assert len(compress_calls) == 1
+    assert len(store._articles["job-1"]) < len(article.body_markdown.encode("utf-8"))
+
+    encoded = store.get_encoded("job-1", "gzip")
+    assert store.get_encoded("job-1", "gzip") is encoded
+    assert gzip.decompress(encoded).startswith(b'{"id":"job-1"')
+
+    job = store.get("job-1")
+    assert job.status == JobStatus.completed
+    assert job.article == article
+    # the stored article comes back in its compact fragment form
+    assert len(job.article.body.sections) == len(article.body.sections)
+    assert job.article.body.sections[0].paragraphs[-1].parts == article.body.sections[0].paragraphs[-1].parts
+
+
+def test_accepts_encoding():
+    assert accepts_encoding("gzip, deflate, br", "gzip")
+    assert accepts_encoding("*", "zstd")
+    assert not accepts_encoding("gzip;q=0", "gzip")
+    assert not accepts_encoding("br", "gzip")
+    assert not accepts_encoding(None, "gzip")
+    # an explicit token wins over the wildcard
+    assert not accepts_encoding("*, gzip;q=0", "gzip")
+    assert accepts_encoding("*;q=0, gzip", "gzip")
+    assert choose_encoding("gzip, deflate", ["zstd", "gzip"]) == "gzip"
+    assert choose_encoding("br", ["zstd", "gzip"]) is None
+
+
+def test_get_job_serves_precompressed_body(monkeypatch):
+    store = JobStore()
+    monkeypatch.setitem(app.dependency_overrides, api.get_job_store, lambda: store)
+    store.create(_make_job())
+    store.save_article("job-1", _make_article())
+    store.update_status("job-1", JobStatus.completed)
+
+    client = TestClient(app)
+
+    # what the requests library sends by default
+    compressed = client.get("/api/jobs/job-1", headers={"Accept-Encoding": "gzip, deflate"})
+    assert compressed.status_code == 200
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert compressed.json()["article"]["h1"]
+
+    plain = client.get("/api/jobs/job-1", headers={"Accept-Encoding": "identity"})
+    assert plain.status_code == 200
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+    assert plain.json() == compressed.json()
+
+
+def test_gzip_codec_is_deterministic():
+    codec = Codec(encoding="gzip")
+    data = b"bridge paragraph " * 100
+    assert codec.compress(data) == codec.compress(data)
+    assert gzip.decompress(codec.compress(data)) == data
+
+
+def _seed_store() -> JobStore:
+    store = JobStore()
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    topics = ["remote work tools", "Remote hiring", "seo basics"]
+    for i in range(9):
+        store.create(_make_job(f"job-{i}", topic=topics[i % 3], created_at=start + timedelta(minutes=i)))
+    for i in (1, 4, 7):
+        store.update_status(f"job-{i}", JobStatus.failed, error_message="boom")
+    return store
+
+
+def test_list_paginates_newest_first():
+    store = _seed_store()
+
+    page, cursor = store.list(limit=4)
+    assert [j.id for j in page] == ["job-8", "job-7", "job-6", "job-5"]
+    assert cursor is not None
+
+    page, cursor = store.list(limit=4, cursor=cursor)
+    assert [j.id for j in page] == ["job-4", "job-3", "job-2", "job-1"]
+
+    page, cursor = store.list(limit=4, cursor=cursor)
+    assert [j.id for j in page] == ["job-0"]
+    assert cursor is None
+
+
+def test_list_filters_use_indexes_kept_in_sync():
+    store = _seed_store()
+
+    failed, _ = store.list(status=JobStatus.failed)
+    assert [j.id for j in failed] == ["job-7", "job-4", "job-1"]
+    assert all(j.article is None for j in failed)
+
+    store.update_status("job-4", JobStatus.completed)
+    failed, _ = store.list(status=JobStatus.failed)
+    assert [j.id for j in failed] == ["job-7", "job-1"]
+
+    remote, _ = store.list(topic_prefix="REMOTE")
+    assert [j.id for j in remote] == ["job-7", "job-6", "job-4", "job-3", "job-1", "job-0"]
+
+    remote_failed, _ = store.list(topic_prefix="remote", status=JobStatus.failed)
+    assert [j.id for j in remote_failed] == ["job-7", "job-1"]
+
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    window, _ = store.list(
+        created_after=start + timedelta(minutes=2),
+        created_before=start + timedelta(minutes=5),
+        language=Language.en,
+    )
+    assert [j.id for j in window] == ["job-4", "job-3", "job-2"]
+
+
+class _CountingDict(dict):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.reads = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        return super().__getitem__(key)
+
+
+def test_list_walks_the_most_selective_index():
+    store = JobStore()
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i in range(500):
+        topic = "rare topic" if i in (10, 400) else f"common topic {i % 7}"
+        store.create(_make_job(f"job-{i}", topic=topic, created_at=start + timedelta(minutes=i)))
+        store.update_status(f"job-{i}", JobStatus.completed)
+
+    store._jobs = _CountingDict(store._jobs)
+    page, _ = store.list(status=JobStatus.completed, topic_prefix="rare", language=Language.en)
+
+    assert [j.id for j in page] == ["job-400", "job-10"]
+    # only the two topic matches are inspected, not all 500 completed jobs
+    assert store._jobs.reads == 2
+
+
+def test_list_jobs_endpoint(monkeypatch):
+    store = _seed_store()
+    monkeypatch.setitem(app.dependency_overrides, api.get_job_store, lambda: store)
+    client = TestClient(app)
+
+    response = client.get("/api/jobs", params={"status": "failed", "limit": 2})
+    assert response.status_code == 200
+    body = response.json()
+    assert [j["id"] for j in body["items"]] == ["job-7", "job-4"]
+
+    response = client.get("/api/jobs", params={"status": "failed", "limit": 2, "cursor": body["next_cursor"]})
+    assert [j["id"] for j in response.json()["items"]] == ["job-1"]
+    assert response.json()["next_cursor"] is None
+
+    assert client.get("/api/jobs", params={"cursor": "not-a-cursor"}).status_code == 400
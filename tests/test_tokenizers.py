@@ -0,0 +1,71 @@
+import re
+import time
+
+from app.schemas import Language, SERPResult
+from app.services.analyzer import SERPAnalyzer
+from app.services.tokenizers import Tokenizer, default_tokenizer, get_tokenizer, register_tokenizer
+
+# Far below what a laptop does (millions/sec); catches pathological regressions
+MIN_TOKENS_PER_SECOND = 200_000
+
+
+def test_tokenizer_keeps_accented_and_non_latin_words():
+    tokenizer = get_tokenizer(Language.fr)
+    assert tokenizer.tokenize("Équipes à distance: télétravail, café") == ["équipes", "distance", "télétravail", "café"]
+    # decomposed accents are normalized before matching
+    assert tokenizer.tokenize("cafe\u0301") == ["caf\u00e9"]
+    assert get_tokenizer(Language.en).tokenize("Zusammenarbeit über Москва 2025 don't") == [
+        "zusammenarbeit",
+        "über",
+        "москва",
+        "don",
+    ]
+
+
+def test_tokenizer_keeps_combining_marks_and_case_folds_first():
+    tokenizer = get_tokenizer(Language.en)
+    assert tokenizer.tokenize("हिन्दी भाषा किताबें") == ["हिन्दी", "भाषा", "किताबें"]
+    assert tokenizer.tokenize("İstanbul") == ["i\u0307stanbul"]
+    assert tokenizer.tokenize("abc123def_ghi") == ["abc", "def", "ghi"]
+
+
+def test_register_tokenizer_overrides_default():
+    try:
+        register_tokenizer(
+            Language.es,
+            lambda language: Tokenizer(language, re.compile(r"[^\W\d_]{2,}"), stopwords={"la"}),
+        )
+        assert get_tokenizer(Language.es).content_tokens("la casa es") == ["casa", "es"]
+    finally:
+        register_tokenizer(Language.es, default_tokenizer)
+    assert get_tokenizer(Language.es).content_tokens("la casa es") == ["casa"]
+
+
+def test_tokenizers_are_cached_per_language():
+    assert get_tokenizer(Language.de) is get_tokenizer(Language.de)
+    assert get_tokenizer(Language.de) is not get_tokenizer(Language.es)
+    assert isinstance(get_tokenizer(Language.es).stopwords, frozenset)
+
+
+def test_analyzer_uses_language_stopwords():
+    serp_results = [
+        SERPResult(
+            rank=1,
+            url="https://example.com/de",
+            title="Die besten Tools für Zusammenarbeit im Team",
+            snippet="Zusammenarbeit und Kommunikation mit den besten Tools für Teams.",
+        )
+    ]
+    analysis = SERPAnalyzer().analyze(topic="tools für teams", serp_results=serp_results, language=Language.de)
+    assert analysis.secondary_keywords[0] == "zusammenarbeit"
+    assert not {"die", "und", "für", "mit", "den"} & set(analysis.secondary_keywords)
+
+
+def test_tokenizer_throughput():
+    text = "Zusammenarbeit, Kommunikation und Automatisierung für verteilte Teams im Büro. " * 5000
+    for language in Language:
+        tokenizer = get_tokenizer(language)
+        start = time.perf_counter()
+        tokens = tokenizer.tokenize(text)
+        elapsed = time.perf_counter() - start
+        assert len(tokens) / elapsed > MIN_TOKENS_PER_SECOND, language
@@ -0,0 +1,232 @@
+import json
+import logging
+import socket
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import api, webhooks
+from app.main import app
+from app.schemas import Job, JobStatus, Language
+from app.store import JobStore
+from app.webhooks import WebhookDispatcher, sign, validate_callback_url
+
+SECRET = "test-secret"
+
+
+class StubReceiver:
+    """
+    Local HTTP endpoint that records webhook batches. Set `status` to make it
+    fail deliveries, and `location` to make it redirect.
+    """
+
+    def __init__(self) -> None:
+        self.requests = []
+        self.status = 200
+        self.location = None
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                receiver.requests.append((dict(self.headers), body))
+                self.send_response(receiver.status)
+                if receiver.location:
+                    self.send_header("Location", receiver.location)
+                self.end_headers()
+
+            do_GET = do_POST
+
+            def log_message(self, *args):
+                pass
+
+        self._server = HTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}/hook"
+        Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def events(self):
+        return [e for _, body in self.requests for e in json.loads(body)["events"]]
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def receiver():
+    stub = StubReceiver()
+    yield stub
+    stub.close()
+
+
+def _dispatcher(tmp_path, **kwargs) -> WebhookDispatcher:
+    kwargs.setdefault("secret", SECRET)
+    # the stub receiver is on loopback, which is rejected unless allowlisted
+    kwargs.setdefault("allowed_hosts", ["127.0.0.1"])
+    return WebhookDispatcher(outbox_path=str(tmp_path / "outbox.sqlite3"), **kwargs)
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_completed_jobs_deliver_signed_batched_webhook(tmp_path, receiver, monkeypatch):
+    dispatcher = _dispatcher(tmp_path)
+    monkeypatch.setitem(app.dependency_overrides, api.get_job_store, lambda: JobStore())
+    monkeypatch.setitem(app.dependency_overrides, api.get_webhook_dispatcher, lambda: dispatcher)
+    client = TestClient(app)
+
+    ids = {
+        client.post("/api/jobs", json={"topic": topic, "callback_url": receiver.url}).json()["id"]
+        for topic in ("remote onboarding", "seo basics")
+    }
+    client.post("/api/jobs", json={"topic": "no callback"})
+
+    _wait_for(lambda: len(receiver.events) == 2)
+    assert dispatcher.pending() == 0
+    dispatcher.stop()
+
+    assert {e["job_id"] for e in receiver.events} == ids
+    assert {e["type"] for e in receiver.events} == {"job.completed"}
+    for headers, body in receiver.requests:
+        assert headers["X-Webhook-Signature"] == sign(SECRET, headers["X-Webhook-Timestamp"], body)
+
+
+def _failed_job(callback_url: str) -> Job:
+    return Job(
+        id="job-1",
+        topic="remote onboarding",
+        target_word_count=800,
+        language=Language.en,
+        status=JobStatus.failed,
+        error_message="boom",
+        callback_url=callback_url,
+    )
+
+
+def test_failed_delivery_is_retried_and_survives_restart(tmp_path, receiver):
+    receiver.status = 500
+    first = _dispatcher(tmp_path, base_delay=0.05)
+    first.notify(_failed_job(receiver.url))
+    _wait_for(lambda: len(receiver.requests) >= 2)  # initial attempt plus a retry
+    assert first.pending() == 1
+    first.stop()
+
+    # A stopped dispatcher stays stopped; late events are not sent
+    first.notify(_failed_job(receiver.url))
+    assert first._thread is None or not first._thread.is_alive()
+
+    # A fresh dispatcher on the same outbox picks the event up again
+    receiver.status = 200
+    second = _dispatcher(tmp_path)
+    deadline = time.monotonic() + 5
+    while second.pending():
+        assert time.monotonic() < deadline, "timed out"
+        second.deliver_due()
+        time.sleep(0.01)
+    second.stop()
+    assert receiver.events[-1]["type"] == "job.failed"
+    assert receiver.events[-1]["error_message"] == "boom"
+
+
+def test_events_are_dropped_after_max_attempts(tmp_path, receiver):
+    receiver.status = 503
+    dispatcher = _dispatcher(tmp_path, base_delay=0.0, max_attempts=2)
+    dispatcher.notify(_failed_job(receiver.url))
+
+    _wait_for(lambda: dispatcher.pending() == 0)
+    dispatcher.stop()
+    assert len(receiver.requests) == 2
+
+
+def test_callback_targets_are_restricted(tmp_path, receiver, monkeypatch):
+    for url in ("http://127.0.0.1/hook", "http://169.254.169.254/latest", "http://10.0.0.5/", "ftp://example.com/"):
+        with pytest.raises(ValueError):
+            validate_callback_url(url)
+    validate_callback_url("http://127.0.0.1/hook", allowed_hosts={"127.0.0.1"})
+
+    monkeypatch.setitem(app.dependency_overrides, api.get_job_store, lambda: JobStore())
+    client = TestClient(app)
+
+    strict = _dispatcher(tmp_path, allowed_hosts=[])
+    monkeypatch.setitem(app.dependency_overrides, api.get_webhook_dispatcher, lambda: strict)
+    response = client.post("/api/jobs", json={"topic": "x", "callback_url": receiver.url})
+    assert response.status_code == 400
+    assert "non-public" in response.json()["detail"]
+    strict.stop()
+
+    unsigned = WebhookDispatcher(outbox_path=str(tmp_path / "unsigned.sqlite3"), secret="")
+    monkeypatch.setitem(app.dependency_overrides, api.get_webhook_dispatcher, lambda: unsigned)
+    response = client.post("/api/jobs", json={"topic": "x", "callback_url": receiver.url})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Webhooks are not configured on this server"
+    unsigned.stop()
+    assert receiver.requests == []
+
+
+@pytest.fixture
+def manual_delivery(monkeypatch):
+    # Keep the background thread off so the test drives deliver_due itself
+    monkeypatch.setattr(WebhookDispatcher, "start", lambda self: None)
+
+
+def test_redirects_are_not_followed(tmp_path, receiver, manual_delivery):
+    internal = StubReceiver()
+    try:
+        receiver.status = 302
+        receiver.location = internal.url.replace("/hook", "/latest/meta-data")
+        dispatcher = _dispatcher(tmp_path)
+        dispatcher.notify(_failed_job(receiver.url))
+        dispatcher.deliver_due()
+        assert len(receiver.requests) == 1
+        assert internal.requests == []
+        assert dispatcher.pending() == 1  # a 3xx is a failed attempt
+        dispatcher.stop()
+    finally:
+        internal.close()
+
+
+def test_connection_goes_to_the_checked_address(tmp_path, receiver, monkeypatch, manual_delivery):
+    # "rebind.test" passed validation earlier but now resolves to loopback
+    real_getaddrinfo = socket.getaddrinfo
+
+    def getaddrinfo(host, *args, **kwargs):
+        return real_getaddrinfo("127.0.0.1" if host == "rebind.test" else host, *args, **kwargs)
+
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    dispatcher = _dispatcher(tmp_path, allowed_hosts=[])
+    dispatcher.notify(_failed_job(receiver.url.replace("127.0.0.1", "rebind.test")))
+    dispatcher.deliver_due()
+    assert receiver.requests == []
+    assert dispatcher.pending() == 1
+    dispatcher.stop()
+
+
+def test_backlog_is_read_in_bounded_windows(tmp_path, receiver, monkeypatch, manual_delivery):
+    monkeypatch.setattr(webhooks, "_WINDOW_BATCHES", 2)
+    dispatcher = _dispatcher(tmp_path, batch_size=2)
+    for _ in range(5):
+        dispatcher.notify(_failed_job(receiver.url))
+
+    dispatcher.deliver_due()
+    assert dispatcher.pending() == 1  # one window: two batches of two
+    assert [len(json.loads(body)["events"]) for _, body in receiver.requests] == [2, 2]
+    dispatcher.deliver_due()
+    assert dispatcher.pending() == 0
+    dispatcher.stop()
+
+
+def test_disabled_dispatcher_creates_no_outbox(tmp_path, caplog):
+    with caplog.at_level(logging.INFO, logger="app.webhooks"):
+        dispatcher = WebhookDispatcher(outbox_path=str(tmp_path / "outbox.sqlite3"), secret="")
+    assert not (tmp_path / "outbox.sqlite3").exists()
+    assert [r.levelno for r in caplog.records] == [logging.INFO]
+    assert dispatcher.pending() == 0
+    dispatcher.stop()